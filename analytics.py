@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+from models import FlightType
+from services import TaggedFlight
+from utils import gate_sort_key, parse_api_datetime
+
+CANCELLED_REMARK = "결항"
+# 실제로 도착/출발을 마친 운항편의 운항여부. 그 전의 estimatedDatetime 은 예상 시각이므로 지연 집계에서 제외
+OPERATED_REMARKS = {
+    FlightType.ARRIVAL: {"도착", "착륙"},
+    FlightType.DEPARTURE: {"출발"},
+}
+ON_TIME_MINUTES = 15            # 계획 대비 15분 이내면 정시로 간주
+MAX_STAND_HOURS = 24            # 도착-출발 짝이 이보다 길면 같은 체류로 보지 않음
+
+# (상한 분, 라벨) - 지연 분포 구간
+DELAY_BUCKETS = [
+    (0, "조기·정시"),
+    (15, "1~15분"),
+    (30, "16~30분"),
+    (60, "31~60분"),
+    (None, "61분 이상"),
+]
+
+_DELAY_HEADERS = ["운항편수", "운항완료편수", "평균지연(분)", "최대지연(분)", "정시율(%)"]
+
+
+@dataclass(slots=True)
+class DelayStats:
+    flights: int = 0
+    measured: int = 0
+    total_minutes: int = 0
+    max_minutes: int | None = None
+    on_time: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(DELAY_BUCKETS))
+
+    def add(self, delay_minutes: int | None):
+        self.flights += 1
+        if delay_minutes is None:
+            return
+        self.measured += 1
+        self.total_minutes += delay_minutes
+        if self.max_minutes is None or delay_minutes > self.max_minutes:
+            self.max_minutes = delay_minutes
+        if delay_minutes <= ON_TIME_MINUTES:
+            self.on_time += 1
+        for index, (upper, _) in enumerate(DELAY_BUCKETS):
+            if upper is None or delay_minutes <= upper:
+                self.buckets[index] += 1
+                break
+
+    def row(self) -> list:
+        if not self.measured:
+            return [self.flights, 0, None, None, None, *self.buckets]
+        return [
+            self.flights,
+            self.measured,
+            round(self.total_minutes / self.measured, 1),
+            self.max_minutes,
+            round(self.on_time / self.measured * 100, 1),
+            *self.buckets,
+        ]
+
+
+@dataclass(slots=True)
+class AnalyticsReport:
+    total: int = 0
+    cancelled: int = 0
+    delay_by_gate: dict[str, DelayStats] = field(default_factory=dict)
+    delay_by_airline: dict[str, DelayStats] = field(default_factory=dict)
+    delay_by_hour: dict[int, DelayStats] = field(default_factory=dict)
+    # 게이트별 시간대(0~23시) 점유 분 합계, 집계 기간 일수
+    occupancy: dict[str, list[float]] = field(default_factory=dict)
+    days: set[date] = field(default_factory=set)
+    remarks: Counter = field(default_factory=Counter)
+    cancelled_by_gate: Counter = field(default_factory=Counter)
+    # (등록기호, 게이트) → [(시각, 출도착)] - 순회 후 도착·출발 짝을 맞춰 점유 구간 계산
+    stand_events: dict[tuple[str, str], list[tuple[datetime, FlightType]]] = field(default_factory=dict)
+
+    def tables(self) -> list[tuple[str, list[str], list[list]]]:
+        """(시트명, 헤더, 행) 목록. 엑셀 시트와 화면 표가 같은 데이터를 사용합니다."""
+        bucket_headers = [label for _, label in DELAY_BUCKETS]
+        return [
+            (
+                "지연-게이트",
+                ["게이트", *_DELAY_HEADERS, *bucket_headers, "결항", "결항률(%)"],
+                [
+                    [
+                        gate,
+                        *stats.row(),
+                        self.cancelled_by_gate[gate],
+                        round(self.cancelled_by_gate[gate] / stats.flights * 100, 1),
+                    ]
+                    for gate, stats in sorted(self.delay_by_gate.items(), key=lambda kv: gate_sort_key(kv[0]))
+                ],
+            ),
+            (
+                "지연-항공사",
+                ["항공사", *_DELAY_HEADERS, *bucket_headers],
+                [[airline, *stats.row()] for airline, stats in sorted(self.delay_by_airline.items())],
+            ),
+            (
+                "지연-시간대",
+                ["시간대", *_DELAY_HEADERS, *bucket_headers],
+                [[f"{hour:02d}시", *stats.row()] for hour, stats in sorted(self.delay_by_hour.items())],
+            ),
+            (
+                "게이트 점유율",
+                ["게이트", *[f"{hour:02d}" for hour in range(24)], "일평균 점유(시간)"],
+                [
+                    [
+                        gate,
+                        *[round(minutes / (60 * len(self.days)) * 100, 1) for minutes in minutes_by_hour],
+                        round(sum(minutes_by_hour) / 60 / len(self.days), 1),
+                    ]
+                    for gate, minutes_by_hour in sorted(self.occupancy.items(), key=lambda kv: gate_sort_key(kv[0]))
+                ],
+            ),
+            (
+                "운항상태",
+                ["운항여부", "편수", "비율(%)"],
+                [
+                    [remark, count, round(count / self.total * 100, 1)]
+                    for remark, count in self.remarks.most_common()
+                ],
+            ),
+        ]
+
+
+def build_analytics(flights: Iterable[TaggedFlight]) -> AnalyticsReport:
+    """운항 목록을 한 번만 순회하며 지연·운항상태 집계를 누적하고,
+    점유 계산에 필요한 도착·출발 시각만 등록기호·게이트별로 모아 마지막에 짝을 맞춥니다."""
+    report = AnalyticsReport()
+
+    for tagged in flights:
+        item = tagged.item
+        if not item.is_master:
+            continue
+
+        scheduled = parse_api_datetime(item.scheduled_datetime)
+        if scheduled is None:
+            continue
+
+        remark = item.remark or "-"
+        gate = item.gate_number.strip().upper() or "-"
+        report.total += 1
+        report.days.add(scheduled.date())
+        report.remarks[remark] += 1
+
+        cancelled = remark == CANCELLED_REMARK
+        if cancelled:
+            report.cancelled += 1
+            report.cancelled_by_gate[gate] += 1
+
+        operated = remark in OPERATED_REMARKS[tagged.flight_type]
+        actual = parse_api_datetime(item.actual_datetime) if operated else None
+        delay = int((actual - scheduled).total_seconds() // 60) if actual else None
+
+        airline = item.flight_number[:2] or "-"
+        for table, key in (
+            (report.delay_by_gate, gate),
+            (report.delay_by_airline, airline),
+            (report.delay_by_hour, scheduled.hour),
+        ):
+            stats = table.get(key)
+            if stats is None:
+                stats = table[key] = DelayStats()
+            stats.add(delay)
+
+        # 점유 계산용 이벤트: 실제(예상) 시각이 있으면 그것을, 없으면 계획 시각 사용
+        registration = item.registration_number.strip().upper()
+        if gate != "-" and registration not in ("", "-") and not cancelled:
+            event_time = parse_api_datetime(item.actual_datetime) or scheduled
+            report.stand_events.setdefault((registration, gate), []).append((event_time, tagged.flight_type))
+
+    _accumulate_occupancy(report)
+    return report
+
+
+def _accumulate_occupancy(report: AnalyticsReport):
+    """같은 등록기호가 같은 게이트에 도착한 뒤 다음 출발까지를 점유 구간으로 보고 시간대별 분을 합산."""
+    for (_, gate), events in report.stand_events.items():
+        events.sort(key=lambda event: event[0])
+        arrived_at: datetime | None = None
+        for event_time, flight_type in events:
+            if flight_type is FlightType.ARRIVAL:
+                arrived_at = event_time
+                continue
+            if arrived_at is not None and timedelta(0) < event_time - arrived_at <= timedelta(hours=MAX_STAND_HOURS):
+                minutes_by_hour = report.occupancy.get(gate)
+                if minutes_by_hour is None:
+                    minutes_by_hour = report.occupancy[gate] = [0.0] * 24
+                _spread_minutes(minutes_by_hour, arrived_at, event_time)
+            arrived_at = None
+    report.stand_events.clear()
+
+
+def _spread_minutes(minutes_by_hour: list[float], start: datetime, end: datetime):
+    cursor = start
+    while cursor < end:
+        next_hour = cursor.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        segment_end = min(next_hour, end)
+        minutes_by_hour[cursor.hour] += (segment_end - cursor).total_seconds() / 60
+        cursor = segment_end
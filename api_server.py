@@ -0,0 +1,259 @@
+"""
+============================================================
+api_server.py - 게이트 현황 JSON 조회 API (읽기 전용)
+============================================================
+PBB 벽면 디스플레이·사내 스크립트의 폴링용 경량 HTTP 서버입니다.
+Streamlit 없이 services / snapshot_cache 를 그대로 사용합니다.
+
+실행:
+  SERVICE_KEY=... python api_server.py
+
+엔드포인트 (date=YYYYMMDD, time=HHMM 생략 시 현재 KST, date 는 오늘 -3일 ~ +6일):
+  GET /gates/<게이트>?date=&time=&limit=   다음 운항편 + 이후 예정 목록 (최대 limit 건)
+  GET /board?terminal=&date=&time=         터미널 게이트별 다음 운항편
+  GET /export?terminal=&date=              엑셀 다운로드와 같은 행 데이터
+
+응답마다 ETag 를 붙이고, If-None-Match 가 일치하면 본문 없이 304 를 반환합니다.
+ETag 는 운항 데이터만으로 계산하고, 스냅샷 조회 시각은 X-Fetched-At / Last-Modified 헤더로 보냅니다.
+============================================================
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+import config
+from excel_export import export_rows
+from services import GateFlight, TaggedFlight, filter_future_flights, select_gate_flights
+from snapshot_cache import DaySnapshot, get_snapshot
+from utils import allowed_date_range, gate_sort_key
+
+_DEFAULT_LIMIT = 10
+_RESPONSE_CACHE_LIMIT = 1024
+
+
+class _BadRequest(Exception):
+    pass
+
+
+_SERVICE_KEY_PATTERN = re.compile(r"(serviceKey=)[^&\s]+", re.IGNORECASE)
+
+# (경로, 파라미터, 스냅샷 시각) → (ETag, 본문). 스냅샷이 바뀌기 전까지 직렬화를 다시 하지 않음
+_responses: dict[tuple, tuple[str, bytes]] = {}
+_responses_lock = threading.Lock()
+
+
+def _flight_json(gf: GateFlight) -> dict:
+    item = gf.item
+    return {
+        "type": gf.flight_type.value,
+        "flight": item.flight_number,
+        "scheduled": item.scheduled_datetime,
+        "estimated": item.actual_datetime,
+        "airport": item.airport_name,
+        "aircraft": item.aircraft_type,
+        "registration": item.registration_number,
+        "status": item.remark,
+        "gate": item.gate_number,
+        "terminal": item.terminal_id,
+    }
+
+
+def _terminal_flights(snapshot: DaySnapshot, terminal_id: str | None) -> list[TaggedFlight]:
+    if terminal_id is None:
+        return snapshot.flights
+    return [tf for tf in snapshot.flights if tf.item.terminal_id == terminal_id]
+
+
+def _gate_payload(snapshot: DaySnapshot, gate: str, cutoff: datetime, limit: int) -> dict:
+    future = filter_future_flights(select_gate_flights(snapshot.flights, gate), cutoff)
+    return {
+        "gate": gate,
+        "next": _flight_json(future[0]) if future else None,
+        "upcoming": [_flight_json(gf) for gf in future[1:limit + 1]],
+    }
+
+
+def _board_payload(snapshot: DaySnapshot, terminal_id: str | None, cutoff: datetime) -> dict:
+    by_gate: dict[str, list[TaggedFlight]] = {}
+    for tf in _terminal_flights(snapshot, terminal_id):
+        gate = tf.item.gate_number.strip().upper()
+        if tf.item.is_master and gate:
+            by_gate.setdefault(gate, []).append(tf)
+
+    board = []
+    for gate in sorted(by_gate, key=gate_sort_key):
+        future = filter_future_flights(select_gate_flights(by_gate[gate], gate), cutoff)
+        board.append({
+            "gate": gate,
+            "next": _flight_json(future[0]) if future else None,
+            "remaining": len(future),
+        })
+    return {"terminal": terminal_id, "gates": board}
+
+
+def _export_payload(snapshot: DaySnapshot, terminal_id: str | None) -> dict:
+    return {
+        "terminal": terminal_id,
+        "columns": [column_name for column_name, _ in config.EXCEL_COLUMNS],
+        "rows": export_rows(_terminal_flights(snapshot, terminal_id)),
+    }
+
+
+def _parse_query(query: dict[str, list[str]]) -> tuple[str, datetime, int, str | None]:
+    now = datetime.now(config.KST)
+    search_date = query.get("date", [now.strftime("%Y%m%d")])[0]
+    search_time = query.get("time", [now.strftime("%H%M")])[0]
+    # strptime 은 "12" 같은 짧은 값도 받아들이므로 자릿수를 먼저 확인
+    if not (re.fullmatch(r"\d{8}", search_date) and re.fullmatch(r"\d{4}", search_time)):
+        raise _BadRequest("date=YYYYMMDD, time=HHMM 형식이어야 합니다.")
+    try:
+        cutoff = datetime.strptime(search_date + search_time, "%Y%m%d%H%M").replace(tzinfo=config.KST)
+    except ValueError:
+        raise _BadRequest("date=YYYYMMDD, time=HHMM 형식이어야 합니다.")
+
+    # 범위 밖 날짜마다 업스트림 전체 조회가 일어나지 않도록 UI와 같은 범위만 허용
+    min_date, max_date = allowed_date_range(now.date())
+    if not min_date <= cutoff.date() <= max_date:
+        raise _BadRequest(f"date 는 {min_date:%Y%m%d} ~ {max_date:%Y%m%d} 범위여야 합니다.")
+
+    try:
+        limit = int(query.get("limit", [_DEFAULT_LIMIT])[0])
+    except ValueError:
+        raise _BadRequest("limit 은 숫자여야 합니다.")
+
+    terminal_id = None
+    if "terminal" in query:
+        terminal_ids = {t.name.upper(): t.terminal_id for t in config.TERMINALS}
+        terminal_ids.update({t.terminal_id: t.terminal_id for t in config.TERMINALS})
+        terminal_id = terminal_ids.get(query["terminal"][0].upper())
+        if terminal_id is None:
+            raise _BadRequest("terminal 은 T1, Con, T2 (또는 P01~P03) 중 하나여야 합니다.")
+
+    return search_date, cutoff, max(limit, 1), terminal_id
+
+
+def _render(route: str, gate: str, query: dict[str, list[str]]) -> tuple[str, bytes, datetime]:
+    search_date, cutoff, limit, terminal_id = _parse_query(query)
+    snapshot = get_snapshot(search_date)
+
+    # export 는 시각과 무관하므로 cutoff 를 키에서 제외
+    key = (route, gate, cutoff if route != "export" else None, limit, terminal_id, snapshot.fetched_at)
+    with _responses_lock:
+        cached = _responses.get(key)
+    if cached is not None:
+        return (*cached, snapshot.fetched_at)
+
+    if route == "gates":
+        payload = _gate_payload(snapshot, gate, cutoff, limit)
+    elif route == "board":
+        payload = _board_payload(snapshot, terminal_id, cutoff)
+    else:
+        payload = _export_payload(snapshot, terminal_id)
+
+    # 조회 시각은 본문에 넣지 않음: 스냅샷이 갱신돼도 운항 데이터가 같으면 ETag 유지
+    payload["date"] = search_date
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+
+    with _responses_lock:
+        if len(_responses) >= _RESPONSE_CACHE_LIMIT:
+            _responses.clear()
+        _responses[key] = (etag, body)
+    return etag, body, snapshot.fetched_at
+
+
+def _redact(text: str) -> str:
+    text = _SERVICE_KEY_PATTERN.sub(r"\1***", text)
+    return text.replace(config.SERVICE_KEY, "***") if config.SERVICE_KEY else text
+
+
+class GateStatusHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        query = parse_qs(url.query)
+
+        if len(parts) == 2 and parts[0] == "gates":
+            route, gate = "gates", parts[1].strip().upper()
+        elif len(parts) == 1 and parts[0] in ("board", "export"):
+            route, gate = parts[0], ""
+        else:
+            self._send_error(404, "지원하지 않는 경로입니다.")
+            return
+
+        try:
+            etag, body, fetched_at = _render(route, gate, query)
+        except _BadRequest as error:
+            self._send_error(400, str(error))
+            return
+        except requests.RequestException as error:
+            # 업스트림 오류 메시지에는 serviceKey 가 포함된 URL 이 있으므로 서버 로그에만 가려서 남김
+            print(f"[JSON API] 운항 API 조회 실패: {_redact(str(error))}")
+            self._send_error(502, "운항 API 조회 실패")
+            return
+
+        client_etags = {tag.strip().removeprefix("W/") for tag in self.headers.get("If-None-Match", "").split(",")}
+        if etag in client_etags or "*" in client_etags:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self._send_fetched_at(fetched_at)
+            self.end_headers()
+            return
+
+        self._send_json(200, body, etag, fetched_at)
+
+    def _send_error(self, status: int, message: str):
+        body = json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+        self._send_json(status, body)
+
+    def _send_json(
+        self,
+        status: int,
+        body: bytes,
+        etag: str | None = None,
+        fetched_at: datetime | None = None,
+    ):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        if etag:
+            self.send_header("ETag", etag)
+        if fetched_at:
+            self._send_fetched_at(fetched_at)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_fetched_at(self, fetched_at: datetime):
+        self.send_header("X-Fetched-At", fetched_at.isoformat(timespec="seconds"))
+        self.send_header("Last-Modified", format_datetime(fetched_at.astimezone(timezone.utc), usegmt=True))
+
+    def log_message(self, format, *args):
+        print(f"[JSON API] {self.address_string()} {format % args}")
+
+
+def main():
+    server = ThreadingHTTPServer((config.API_HOST, config.API_PORT), GateStatusHandler)
+    print(f"[JSON API] http://{config.API_HOST}:{config.API_PORT} 에서 대기 중")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
 
 import streamlit as st
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import config
 import ui_styles
 import ui_gate_search
 import ui_excel_download
+import ui_flight_search
+from utils import allowed_date_range
 
 try:
     if "SERVICE_KEY" in st.secrets:
@@ -34,11 +36,11 @@ st.markdown(
 
 today = datetime.now(config.KST).date()     # 오늘 날짜 (KST 기준)
 now = datetime.now(config.KST)              # 현재 시각 (KST 기준)
-min_date = today + timedelta(days=-3)       # 조회 가능 최소 날짜 (3일 전)
-max_date = today + timedelta(days=6)        # 조회 가능 최대 날짜 (6일 후)
+min_date, max_date = allowed_date_range(today)  # 조회 가능 날짜 범위 (-3일 ~ +6일)
 
 
-tab1, tab2 = st.tabs(["🛬 게이트 출도착 조회", "📊 엑셀 다운로드"])
+tab1, tab2, tab3 = st.tabs(["🛬 게이트 출도착 조회", "🔎 편명·기체 검색", "📊 엑셀 다운로드"])
 
 ui_gate_search.render(tab1, today, now, min_date, max_date)
-ui_excel_download.render(tab2, today, min_date, max_date)
+ui_flight_search.render(tab2, today, min_date, max_date)
+ui_excel_download.render(tab3, today, min_date, max_date)
@@ -8,6 +8,24 @@ SERVICE_KEY = os.environ.get("SERVICE_KEY", "")
 BASE_URL = "https://apis.data.go.kr/B551177/statusOfAllFltDeOdp"
 NUM_OF_ROWS = 10000
 
+MAX_WORKERS = 4                 # 병렬 API 호출 스레드 수
+HTTP_POOL_SIZE = MAX_WORKERS * 2    # 호스트당 keep-alive 연결 수 (헤지 요청 몫 포함)
+CONNECT_TIMEOUT = 5             # 연결 타임아웃 (초)
+READ_TIMEOUT = 30               # 응답 대기 타임아웃 (초)
+
+GATE_SEARCH_BUDGET_SECONDS = 8  # 게이트 조회 전체 허용 시간 (초), 초과 시 저장된 스냅샷 사용
+HEDGE_PERCENTILE = 0.95         # 이 백분위 응답시간이 지나도 응답이 없으면 중복(헤지) 요청 전송
+HEDGE_DEFAULT_DELAY = 1.0       # 응답시간 표본이 부족할 때의 헤지 대기 시간 (초)
+HEDGE_MIN_DELAY = 0.2           # 헤지 대기 시간 하한 (초)
+HEDGE_MIN_SAMPLES = 20          # 백분위 계산에 필요한 최소 표본 수
+HEDGE_SAMPLE_SIZE = 200         # 최근 응답시간 표본 보관 개수
+HEDGE_MAX_WORKERS = 32          # 마감 있는 호출(원 요청 + 헤지)을 실행하는 스레드 수, 연결 풀과 별도
+
+SNAPSHOT_TTL_SECONDS = 120      # 날짜별 운항 스냅샷 재사용 시간 (초)
+
+API_HOST = os.environ.get("API_HOST", "127.0.0.1")    # JSON 조회 API 바인딩 주소 (외부 공개 시 0.0.0.0)
+API_PORT = int(os.environ.get("API_PORT", "8502"))    # JSON 조회 API 포트
+
 TERMINALS = [
     Terminal("T1", "P01"),
     Terminal("Con", "P02"),
@@ -16,6 +34,9 @@ TERMINALS = [
 
 KST = timezone(timedelta(hours=9))
 
+SEARCH_DAYS_BEFORE = 3          # 조회 가능 최소 날짜 (오늘 기준 N일 전)
+SEARCH_DAYS_AFTER = 6           # 조회 가능 최대 날짜 (오늘 기준 N일 후)
+
 EXCEL_COLUMNS = [
     ("운항일자",      "_date"),
     ("출도착",        "_flight_type"),
@@ -3,9 +3,11 @@ from __future__ import annotations
 from io import BytesIO
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.formatting.rule import ColorScaleRule
 from openpyxl.utils import get_column_letter
 
 import config
+from analytics import AnalyticsReport
 from models import FlightItem, FlightType
 from services import TaggedFlight
 from utils import format_date, format_time
@@ -38,28 +40,33 @@ def _resolve_cell_value(item: FlightItem, field: str, flight_type: FlightType) -
         return getattr(item, field, "") or "-"
 
 
-def write_excel_sheet(workbook: Workbook, sheet_name: str, all_items: list[TaggedFlight]):
+def export_rows(all_items: list[TaggedFlight]) -> list[list[str]]:
+    master_items = [tf for tf in all_items if tf.item.is_master]
+    master_items.sort(key=lambda tf: tf.item.scheduled_datetime)
+    return [
+        [_resolve_cell_value(tagged.item, field, tagged.flight_type) for _, field in config.EXCEL_COLUMNS]
+        for tagged in master_items
+    ]
+
+
+def _write_table(workbook: Workbook, sheet_name: str, headers: list[str], rows: list[list]):
     worksheet = workbook.create_sheet(title=sheet_name)
 
-    for column_index, (column_name, _) in enumerate(config.EXCEL_COLUMNS, 1):
+    for column_index, column_name in enumerate(headers, 1):
         cell = worksheet.cell(row=1, column=column_index, value=column_name)
         cell.fill = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
         cell.font = Font(name="맑은 고딕", bold=True, color="FFFFFF", size=10)
         cell.alignment = Alignment(horizontal="center", vertical="center")
         cell.border = THIN_BORDER
 
-    master_items = [tf for tf in all_items if tf.item.is_master]
-    master_items.sort(key=lambda tf: tf.item.scheduled_datetime)
-
-    for row_index, tagged in enumerate(master_items, 2):
-        for column_index, (_, field) in enumerate(config.EXCEL_COLUMNS, 1):
-            value = _resolve_cell_value(tagged.item, field, tagged.flight_type)
+    for row_index, row in enumerate(rows, 2):
+        for column_index, value in enumerate(row, 1):
             cell = worksheet.cell(row=row_index, column=column_index, value=value)
             cell.font = Font(name="맑은 고딕", size=10)
             cell.alignment = Alignment(horizontal="center", vertical="center")
             cell.border = THIN_BORDER
 
-    for column_index in range(1, len(config.EXCEL_COLUMNS) + 1):
+    for column_index in range(1, len(headers) + 1):
         max_length = 0
         for row in worksheet.iter_rows(min_col=column_index, max_col=column_index, values_only=True):
             cell_value = str(row[0]) if row[0] else ""
@@ -68,9 +75,31 @@ def write_excel_sheet(workbook: Workbook, sheet_name: str, all_items: list[Tagge
         worksheet.column_dimensions[get_column_letter(column_index)].width = max(max_length + 3, 10)
 
     worksheet.auto_filter.ref = worksheet.dimensions
+    return worksheet
 
 
-def create_excel_file(terminal_items: dict[str, list[TaggedFlight]]) -> Workbook:
+def write_excel_sheet(workbook: Workbook, sheet_name: str, all_items: list[TaggedFlight]):
+    headers = [column_name for column_name, _ in config.EXCEL_COLUMNS]
+    _write_table(workbook, sheet_name, headers, export_rows(all_items))
+
+
+def write_analytics_sheets(workbook: Workbook, report: AnalyticsReport):
+    for sheet_name, headers, rows in report.tables():
+        worksheet = _write_table(workbook, sheet_name, headers, rows)
+
+        if sheet_name == "게이트 점유율" and rows:
+            # 시간대 칸(B열~Y열)에 히트맵 색상 적용
+            heatmap_range = f"B2:{get_column_letter(25)}{len(rows) + 1}"
+            worksheet.conditional_formatting.add(
+                heatmap_range,
+                ColorScaleRule(start_type="min", start_color="FFFFFF", end_type="max", end_color="F8696B"),
+            )
+
+
+def create_excel_file(
+    terminal_items: dict[str, list[TaggedFlight]],
+    analytics: AnalyticsReport | None = None,
+) -> Workbook:
     workbook = Workbook()
     workbook.remove(workbook.active)
 
@@ -78,6 +107,9 @@ def create_excel_file(terminal_items: dict[str, list[TaggedFlight]]) -> Workbook
         items = terminal_items.get(terminal.terminal_id, [])
         write_excel_sheet(workbook, terminal.name, items)
 
+    if analytics is not None:
+        write_analytics_sheets(workbook, analytics)
+
     return workbook
 
 
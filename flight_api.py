@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-import requests
-
 import config
+from http_client import Deadline, UpstreamClient
 from models import FlightItem, FlightType
 
-_session = requests.Session()
+_client = UpstreamClient(
+    pool_size=config.HTTP_POOL_SIZE,
+    connect_timeout=config.CONNECT_TIMEOUT,
+    read_timeout=config.READ_TIMEOUT,
+    hedge_percentile=config.HEDGE_PERCENTILE,
+    hedge_default_delay=config.HEDGE_DEFAULT_DELAY,
+    hedge_min_delay=config.HEDGE_MIN_DELAY,
+    hedge_min_samples=config.HEDGE_MIN_SAMPLES,
+    hedge_sample_size=config.HEDGE_SAMPLE_SIZE,
+    hedge_max_workers=config.HEDGE_MAX_WORKERS,
+)
 
 _API_FIELD_MAP = {
     "flightId":          "flight_number",
@@ -31,7 +40,12 @@ def _to_flight_item(raw: dict) -> FlightItem:
     return FlightItem(**kwargs)
 
 
-def _fetch_pages(operation: str, search_date: str, **extra_params) -> list[dict]:
+def _fetch_pages(
+    operation: str,
+    search_date: str,
+    deadline: Deadline | None = None,
+    **extra_params,
+) -> list[dict]:
     url = f"{config.BASE_URL}/{operation}"
     all_items: list[dict] = []
     page_number = 1
@@ -47,9 +61,7 @@ def _fetch_pages(operation: str, search_date: str, **extra_params) -> list[dict]
             **extra_params,
         }
 
-        response = _session.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        data = _client.get_json(url, params, deadline=deadline)
 
         body = data.get("response", {}).get("body", {})
         total_count = body.get("totalCount", 0)
@@ -68,6 +80,11 @@ def _fetch_pages(operation: str, search_date: str, **extra_params) -> list[dict]
     return all_items
 
 
-def fetch_flights(flight_type: FlightType, search_date: str, **extra_params) -> list[FlightItem]:
-    raw_items = _fetch_pages(flight_type.operation, search_date, **extra_params)
+def fetch_flights(
+    flight_type: FlightType,
+    search_date: str,
+    deadline: Deadline | None = None,
+    **extra_params,
+) -> list[FlightItem]:
+    raw_items = _fetch_pages(flight_type.operation, search_date, deadline=deadline, **extra_params)
     return [_to_flight_item(raw) for raw in raw_items]
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+# 호출 측에서 대체 데이터로 넘어가야 하는 업스트림 실패 (마감 초과, 연결·HTTP·JSON 오류)
+UPSTREAM_ERRORS = (DeadlineExceeded, requests.RequestException)
+
+
+class Deadline:
+    """UI 동작부터 API 호출까지 전달되는 절대 마감 시각 (time.monotonic 기준)."""
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> Deadline:
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+class UpstreamClient:
+    """apis.data.go.kr 전용 HTTP 클라이언트.
+
+    연결 풀(HTTPAdapter)은 모든 스레드가 공유하여 keep-alive 연결을 재사용하고,
+    requests.Session 은 스레드마다 따로 두어 동시 호출 시 세션 상태를 공유하지 않습니다.
+    마감 시각이 주어지면 최근 응답시간 백분위가 지나도록 응답이 없을 때
+    같은 요청을 한 번 더 보내고(헤지) 먼저 온 응답을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        pool_size: int,
+        connect_timeout: float,
+        read_timeout: float,
+        hedge_percentile: float = 0.95,
+        hedge_default_delay: float = 1.0,
+        hedge_min_delay: float = 0.2,
+        hedge_min_samples: int = 20,
+        hedge_sample_size: int = 200,
+        hedge_max_workers: int = 32,
+    ):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.hedge_percentile = hedge_percentile
+        self.hedge_default_delay = hedge_default_delay
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_min_samples = hedge_min_samples
+        # 단일 호스트만 호출하므로 풀은 1개. requests 는 풀 대기 타임아웃을 넘기지 않으므로
+        # 블로킹하지 않고, 풀이 가득 차면 새 연결을 열되 pool_size 개까지만 keep-alive 로 유지
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=False)
+        self._local = threading.local()
+        self._latencies: deque[float] = deque(maxlen=hedge_sample_size)
+        self._latencies_lock = threading.Lock()
+        # 마감이 지나 버려진 요청도 읽기 타임아웃까지 작업자를 점유하므로 연결 풀과 별도로 넉넉히 둠
+        self._hedge_executor = ThreadPoolExecutor(max_workers=hedge_max_workers, thread_name_prefix="upstream")
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            session.headers.update({
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            })
+            self._local.session = session
+        return session
+
+    def get_json(self, url: str, params: dict, deadline: Deadline | None = None) -> dict:
+        if deadline is None:
+            return self._get(url, params, self.read_timeout)
+        return self._hedged_get(url, params, deadline)
+
+    def _get(self, url: str, params: dict, read_timeout: float) -> dict:
+        response = self._session().get(url, params=params, timeout=(self.connect_timeout, read_timeout))
+        response.raise_for_status()
+        return response.json()
+
+    def _timed_get(self, url: str, params: dict, read_timeout: float, submitted_at: float) -> dict:
+        # 헤지 대상 호출의 응답시간만 표본으로 사용 (엑셀용 전체 조회는 제외).
+        # 작업자 대기 시간도 호출자가 체감하는 지연이므로 제출 시각부터 측정
+        data = self._get(url, params, read_timeout)
+        with self._latencies_lock:
+            self._latencies.append(time.monotonic() - submitted_at)
+        return data
+
+    def hedge_delay(self) -> float:
+        with self._latencies_lock:
+            samples = sorted(self._latencies)
+        if len(samples) < self.hedge_min_samples:
+            return self.hedge_default_delay
+        index = min(int(len(samples) * self.hedge_percentile), len(samples) - 1)
+        return max(samples[index], self.hedge_min_delay)
+
+    def _hedged_get(self, url: str, params: dict, deadline: Deadline) -> dict:
+        if deadline.expired:
+            raise DeadlineExceeded(url)
+
+        def submit() -> Future:
+            read_timeout = min(self.read_timeout, max(deadline.remaining(), 0.1))
+            return self._hedge_executor.submit(self._timed_get, url, params, read_timeout, time.monotonic())
+
+        pending = {submit()}
+        done, pending = wait(pending, timeout=min(self.hedge_delay(), deadline.remaining()))
+        if not done and not deadline.expired:
+            pending.add(submit())
+
+        last_error: Exception | None = None
+        while True:
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    return future.result()
+                last_error = future.exception()
+
+            if not pending or deadline.expired:
+                break
+            done, pending = wait(pending, timeout=deadline.remaining(), return_when=FIRST_COMPLETED)
+
+        # 남은 요청은 버리고(실행 중이면 백그라운드에서 끝남) 마감 초과로 처리
+        for future in pending:
+            future.cancel()
+        if last_error is not None and not deadline.expired:
+            raise last_error
+        raise DeadlineExceeded(url) from last_error
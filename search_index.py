@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import heapq
+import re
+from bisect import bisect_left
+from collections import defaultdict
+
+from services import TaggedFlight
+
+_SEARCH_FIELDS = ("flight_number", "registration_number", "airport_name", "aircraft_type")
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.upper())
+
+
+_PREFIX_CACHE_LIMIT = 4096
+_PRECOMPUTED_PREFIX_LENGTH = 3      # 이 길이 이하의 접두어는 색인 생성 시 미리 계산
+
+
+class FlightSearchIndex:
+    """편명·등록기호·공항명·기종 역색인 + 접두어 검색.
+
+    스냅샷마다 한 번만 만듭니다. 매칭 토큰이 많은 짧은 접두어(3자 이하)는 생성 시
+    미리 합쳐 두고, 더 긴 접두어는 정렬된 토큰 목록에서 bisect 로 범위를 찾아
+    합친 뒤 기억해 둡니다. 여러 검색어는 위치 집합의 교집합으로 좁힙니다.
+    """
+
+    def __init__(self, flights: list[TaggedFlight]):
+        # flights 순서(예정 시각 순)를 그대로 결과 순서로 사용
+        self._flights = flights
+
+        postings: dict[str, set[int]] = defaultdict(set)
+        for position, tagged in enumerate(flights):
+            for field in _SEARCH_FIELDS:
+                for token in _tokenize(getattr(tagged.item, field)):
+                    postings[token].add(position)
+
+        self._postings: dict[str, tuple[int, ...]] = {
+            token: tuple(sorted(positions)) for token, positions in postings.items()
+        }
+        self._tokens = sorted(self._postings)
+
+        short_prefixes: dict[str, set[int]] = defaultdict(set)
+        for token, positions in postings.items():
+            for length in range(1, min(len(token), _PRECOMPUTED_PREFIX_LENGTH) + 1):
+                short_prefixes[token[:length]].update(positions)
+        self._short_prefixes: dict[str, tuple[tuple[int, ...], frozenset[int]]] = {
+            prefix: (tuple(sorted(positions)), frozenset(positions))
+            for prefix, positions in short_prefixes.items()
+        }
+        self._prefix_cache: dict[str, tuple[tuple[int, ...], frozenset[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def search(self, query: str, limit: int = 50) -> tuple[list[TaggedFlight], int]:
+        """(앞에서부터 최대 limit 건의 결과, 전체 매칭 건수)를 반환합니다."""
+        terms = _tokenize(query)
+        if not terms:
+            return [], 0
+
+        entries = [self._prefix_positions(term) for term in terms]
+        if len(entries) == 1:
+            ordered, _ = entries[0]
+            return [self._flights[position] for position in ordered[:limit]], len(ordered)
+
+        # 작은 집합부터 교집합 (C 수준 집합 연산)
+        position_sets = sorted((position_set for _, position_set in entries), key=len)
+        matched = position_sets[0]
+        for position_set in position_sets[1:]:
+            if not matched:
+                break
+            matched = matched & position_set
+
+        first_positions = heapq.nsmallest(limit, matched)
+        return [self._flights[position] for position in first_positions], len(matched)
+
+    def _prefix_positions(self, prefix: str) -> tuple[tuple[int, ...], frozenset[int]]:
+        entry = self._short_prefixes.get(prefix) or self._prefix_cache.get(prefix)
+        if entry is not None:
+            return entry
+        if len(prefix) <= _PRECOMPUTED_PREFIX_LENGTH:
+            # 미리 계산한 접두어에 없으면 매칭되는 토큰이 없음
+            return (), frozenset()
+
+        start = bisect_left(self._tokens, prefix)
+        positions: set[int] = set()
+        for token in self._tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            positions.update(self._postings[token])
+
+        if len(self._prefix_cache) >= _PREFIX_CACHE_LIMIT:
+            self._prefix_cache.clear()
+        entry = (tuple(sorted(positions)), frozenset(positions))
+        self._prefix_cache[prefix] = entry
+        return entry
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import heapq
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Callable
 
-from config import KST, TERMINALS
+from config import KST, MAX_WORKERS, TERMINALS
 from models import FlightItem, FlightType
 from flight_api import fetch_flights
+from http_client import UPSTREAM_ERRORS, Deadline
+from utils import allowed_date_range, parse_api_datetime
 
 
 @dataclass(slots=True)
@@ -26,22 +30,44 @@ class TaggedFlight:
 
 # ── Gate Search ──
 
+_FULL_DAY = "0000"
+
+# (날짜, 게이트, 조회 시작 HHMM) → (조회 시각, 게이트 운항편). 마감 초과·업스트림 오류 시 대체 데이터로 사용
+# 하루 전체 조회는 시작 시각 "0000" 으로 저장
+_last_gate_results: dict[tuple[str, str, str], tuple[datetime, list[GateFlight]]] = {}
+_last_gate_results_lock = threading.Lock()
+_LAST_GATE_RESULTS_LIMIT = 256
+
+# 날짜 → (조회 시각, 하루 전체 운항편). 호출 측(snapshot_cache.peek_day_flights 등)이 넘겨줌
+SnapshotLookup = Callable[[str], "tuple[datetime, list[TaggedFlight]] | None"]
+
+
 def fetch_gate_flights(
     search_date: str,
     gate: str,
     search_from: str,
-) -> tuple[list[GateFlight], float]:
+    deadline: Deadline | None = None,
+    snapshot_lookup: SnapshotLookup | None = None,
+) -> tuple[list[GateFlight], float, datetime | None]:
     start = time.time()
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        future_arrivals = executor.submit(
-            fetch_flights, FlightType.ARRIVAL, search_date, searchFrom=search_from,
-        )
-        future_departures = executor.submit(
-            fetch_flights, FlightType.DEPARTURE, search_date, searchFrom=search_from,
-        )
-        arrivals = future_arrivals.result()
-        departures = future_departures.result()
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_arrivals = executor.submit(
+                fetch_flights, FlightType.ARRIVAL, search_date, deadline=deadline, searchFrom=search_from,
+            )
+            future_departures = executor.submit(
+                fetch_flights, FlightType.DEPARTURE, search_date, deadline=deadline, searchFrom=search_from,
+            )
+            arrivals = future_arrivals.result()
+            departures = future_departures.result()
+    except UPSTREAM_ERRORS as error:
+        fallback = _fallback_gate_flights(search_date, gate, search_from, snapshot_lookup)
+        if fallback is None:
+            raise
+        elapsed = time.time() - start
+        print(f"[게이트 조회] {type(error).__name__} ({elapsed:.2f}초), {fallback[1]:%H:%M:%S} 기준 데이터 사용")
+        return fallback[0], elapsed, fallback[1]
 
     elapsed = time.time() - start
     print(f"[게이트 조회] API 병렬 소요시간: {elapsed:.2f}초")
@@ -50,7 +76,119 @@ def fetch_gate_flights(
         _filter_by_gate(arrivals, gate, FlightType.ARRIVAL)
         + _filter_by_gate(departures, gate, FlightType.DEPARTURE)
     )
-    return result, elapsed
+    _store_gate_result(search_date, gate, search_from, result)
+    return result, elapsed, None
+
+
+def fetch_upcoming_gate_flights(
+    gate: str,
+    reference: datetime,
+    horizon: timedelta,
+    deadline: Deadline | None = None,
+    snapshot_lookup: SnapshotLookup | None = None,
+) -> tuple[list[GateFlight], float, datetime | None]:
+    start = time.time()
+    window_end = reference + horizon
+
+    # 창은 [reference, window_end) 반개구간이므로 마지막 날짜는 window_end 직전 시각 기준,
+    # API 가 조회를 허용하는 날짜 범위 안으로 제한
+    min_date, max_date = allowed_date_range(datetime.now(KST).date())
+    search_dates: list[str] = []
+    day = max(reference.date(), min_date)
+    last_day = min((window_end - timedelta(microseconds=1)).date(), max_date)
+    while day <= last_day:
+        search_dates.append(day.strftime("%Y%m%d"))
+        day += timedelta(days=1)
+
+    if not search_dates:
+        return [], time.time() - start, None
+
+    streams: list[list[GateFlight]] = []
+    stale_since: datetime | None = None
+
+    # 첫날만 기준 시간 이후로 조회, 이후 날짜는 하루 전체 조회
+    def _search_from(search_date: str) -> str:
+        return reference.strftime("%H%M") if search_date == reference.strftime("%Y%m%d") else _FULL_DAY
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            (search_date, flight_type): executor.submit(
+                fetch_flights, flight_type, search_date, deadline=deadline,
+                **({"searchFrom": _search_from(search_date)} if _search_from(search_date) != _FULL_DAY else {}),
+            )
+            for search_date in search_dates
+            for flight_type in (FlightType.ARRIVAL, FlightType.DEPARTURE)
+        }
+
+        for search_date in search_dates:
+            try:
+                day_streams = [
+                    _filter_by_gate(futures[(search_date, flight_type)].result(), gate, flight_type)
+                    for flight_type in (FlightType.ARRIVAL, FlightType.DEPARTURE)
+                ]
+            except UPSTREAM_ERRORS:
+                fallback = _fallback_gate_flights(search_date, gate, _search_from(search_date), snapshot_lookup)
+                if fallback is None:
+                    raise
+                day_streams = [fallback[0]]
+                stale_since = fallback[1] if stale_since is None else min(stale_since, fallback[1])
+            else:
+                _store_gate_result(search_date, gate, _search_from(search_date), day_streams[0] + day_streams[1])
+
+            streams.extend(_sorted_window(flights, reference, window_end) for flights in day_streams)
+
+    elapsed = time.time() - start
+    print(f"[게이트 조회] {len(search_dates)}일 API 병렬 소요시간: {elapsed:.2f}초")
+
+    # 날짜·출도착별로 이미 정렬된 스트림을 힙 기반 k-way 병합
+    merged = list(heapq.merge(*streams, key=lambda gf: gf.parsed_time))
+    return merged, elapsed, stale_since
+
+
+def _store_gate_result(search_date: str, gate: str, search_from: str, result: list[GateFlight]):
+    key = (search_date, gate, search_from)
+    with _last_gate_results_lock:
+        _last_gate_results.pop(key, None)
+        if len(_last_gate_results) >= _LAST_GATE_RESULTS_LIMIT:
+            # 가장 오래전에 저장된 항목부터 제거 (dict 는 삽입 순서 유지)
+            _last_gate_results.pop(next(iter(_last_gate_results)), None)
+        _last_gate_results[key] = (datetime.now(KST), result)
+
+
+def _fallback_gate_flights(
+    search_date: str,
+    gate: str,
+    search_from: str,
+    snapshot_lookup: SnapshotLookup | None,
+) -> tuple[list[GateFlight], datetime] | None:
+    candidates: list[tuple[datetime, list[GateFlight]]] = []
+    day = snapshot_lookup(search_date) if snapshot_lookup else None
+    if day is not None:
+        fetched_at, day_flights = day
+        candidates.append((fetched_at, select_gate_flights(day_flights, gate)))
+
+    # 요청 시작 시각 이전부터 조회한 결과만 요청 범위를 모두 포함하므로 대체 데이터로 사용 가능
+    with _last_gate_results_lock:
+        candidates.extend(
+            cached
+            for (cached_date, cached_gate, cached_from), cached in _last_gate_results.items()
+            if cached_date == search_date and cached_gate == gate and cached_from <= search_from
+        )
+
+    if not candidates:
+        return None
+    fetched_at, gate_flights = max(candidates, key=lambda candidate: candidate[0])
+    return gate_flights, fetched_at
+
+
+def _sorted_window(
+    gate_flights: list[GateFlight],
+    window_start: datetime,
+    window_end: datetime,
+) -> list[GateFlight]:
+    in_window = [gf for gf in gate_flights if window_start <= gf.parsed_time < window_end]
+    in_window.sort(key=lambda gf: gf.parsed_time)
+    return in_window
 
 
 def filter_future_flights(
@@ -62,6 +200,15 @@ def filter_future_flights(
     return future
 
 
+def select_gate_flights(flights: list[TaggedFlight], gate: str) -> list[GateFlight]:
+    arrivals = [tf.item for tf in flights if tf.flight_type is FlightType.ARRIVAL]
+    departures = [tf.item for tf in flights if tf.flight_type is FlightType.DEPARTURE]
+    return (
+        _filter_by_gate(arrivals, gate, FlightType.ARRIVAL)
+        + _filter_by_gate(departures, gate, FlightType.DEPARTURE)
+    )
+
+
 def _filter_by_gate(
     flights: list[FlightItem],
     gate: str,
@@ -81,12 +228,23 @@ def _filter_by_gate(
 
 
 def _parse_scheduled(raw: str) -> datetime | None:
-    if not raw or raw == "-":
-        return None
-    try:
-        return datetime.strptime(raw.strip(), "%Y%m%d%H%M").replace(tzinfo=KST)
-    except ValueError:
-        return None
+    parsed = parse_api_datetime(raw)
+    return parsed.replace(tzinfo=KST) if parsed else None
+
+
+# ── Day Snapshot ──
+
+def fetch_day_flights(search_date: str) -> list[TaggedFlight]:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_arrivals = executor.submit(fetch_flights, FlightType.ARRIVAL, search_date)
+        future_departures = executor.submit(fetch_flights, FlightType.DEPARTURE, search_date)
+        arrivals = future_arrivals.result()
+        departures = future_departures.result()
+
+    tagged = [TaggedFlight(item=item, flight_type=FlightType.ARRIVAL) for item in arrivals]
+    tagged += [TaggedFlight(item=item, flight_type=FlightType.DEPARTURE) for item in departures]
+    tagged.sort(key=lambda tf: tf.item.scheduled_datetime)
+    return tagged
 
 
 # ── Excel Download ──
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from config import KST, SNAPSHOT_TTL_SECONDS
+from search_index import FlightSearchIndex
+from services import TaggedFlight, fetch_day_flights
+from utils import allowed_date_range
+
+
+@dataclass(slots=True)
+class DaySnapshot:
+    search_date: str
+    fetched_at: datetime
+    flights: list[TaggedFlight]
+    index: FlightSearchIndex = field(init=False)
+    _loaded_at: float = field(init=False, default_factory=time.monotonic)
+
+    def __post_init__(self):
+        self.index = FlightSearchIndex(self.flights)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self._loaded_at
+
+
+_snapshots: dict[str, DaySnapshot] = {}
+_lock = threading.Lock()
+_date_locks: dict[str, threading.Lock] = {}
+
+
+def _date_lock(search_date: str) -> threading.Lock:
+    with _lock:
+        return _date_locks.setdefault(search_date, threading.Lock())
+
+
+def get_snapshot(search_date: str) -> DaySnapshot:
+    snapshot = _snapshots.get(search_date)
+    if snapshot is not None:
+        # 만료된 스냅샷은 그대로 돌려주고 백그라운드에서 갱신 (stale-while-revalidate)
+        if snapshot.age_seconds >= SNAPSHOT_TTL_SECONDS:
+            _refresh_in_background(search_date)
+        return snapshot
+
+    # 처음 조회하는 날짜만 동기 로드. 같은 날짜를 여러 세션이 동시에 받지 않도록 날짜별 잠금
+    with _date_lock(search_date):
+        snapshot = _snapshots.get(search_date)
+        if snapshot is None:
+            snapshot = _load(search_date)
+
+    _evict_out_of_range()
+    return snapshot
+
+
+def _load(search_date: str) -> DaySnapshot:
+    start = time.time()
+    snapshot = DaySnapshot(
+        search_date=search_date,
+        fetched_at=datetime.now(KST),
+        flights=fetch_day_flights(search_date),
+    )
+    print(f"[스냅샷] {search_date} {len(snapshot.flights)}건 로드: {time.time() - start:.2f}초")
+    _snapshots[search_date] = snapshot
+    return snapshot
+
+
+def _refresh_in_background(search_date: str):
+    lock = _date_lock(search_date)
+    # 이미 다른 스레드가 갱신 중이면 건너뜀
+    if not lock.acquire(blocking=False):
+        return
+
+    def refresh():
+        try:
+            snapshot = _snapshots.get(search_date)
+            if snapshot is None or snapshot.age_seconds >= SNAPSHOT_TTL_SECONDS:
+                _load(search_date)
+        except Exception as error:
+            print(f"[스냅샷] {search_date} 갱신 실패, 이전 데이터 유지: {type(error).__name__}")
+        finally:
+            lock.release()
+        _evict_out_of_range()
+
+    threading.Thread(target=refresh, name=f"snapshot-{search_date}", daemon=True).start()
+
+
+def _evict_out_of_range():
+    # 조회 가능 범위(-3일 ~ +6일)를 벗어난 날짜는 대체 데이터로도 쓰이지 않으므로 제거
+    min_date, max_date = allowed_date_range(datetime.now(KST).date())
+    keep_from, keep_to = min_date.strftime("%Y%m%d"), max_date.strftime("%Y%m%d")
+    with _lock:
+        for search_date in [d for d in _snapshots if not keep_from <= d <= keep_to]:
+            _snapshots.pop(search_date, None)
+        for search_date in [d for d in _date_locks if not keep_from <= d <= keep_to]:
+            _date_locks.pop(search_date, None)
+
+
+def peek_day_flights(search_date: str) -> tuple[datetime, list[TaggedFlight]] | None:
+    """만료 여부와 관계없이 마지막으로 받은 (조회 시각, 운항편)을 반환 (API 호출 없음).
+
+    services 의 게이트 조회 대체 데이터(snapshot_lookup)로 넘겨 사용합니다.
+    """
+    snapshot = _snapshots.get(search_date)
+    return (snapshot.fetched_at, snapshot.flights) if snapshot is not None else None
@@ -1,5 +1,6 @@
 import streamlit as st
 
+from analytics import build_analytics
 from config import TERMINALS
 from services import fetch_excel_data
 from utils import date_range
@@ -27,6 +28,8 @@ def render(tab, today, min_date, max_date):
             st.error("시작일이 종료일보다 클 수 없습니다.")
             st.stop()
 
+        include_analytics = st.checkbox("지연·게이트 점유·운항상태 분석 포함", value=True, key="excel_analytics")
+
         if st.button("조회 및 엑셀 생성", type="primary", key="excel_gen"):
             start_date_string = start_date.strftime("%Y%m%d")
             end_date_string = end_date.strftime("%Y%m%d")
@@ -52,9 +55,32 @@ def render(tab, today, min_date, max_date):
             st.success(f"총 {total}건 조회 완료")
             st.write(f"{target_terminal}: {len(terminal_items[target_terminal_id])}건")
 
+            report = build_analytics(terminal_items[target_terminal_id]) if include_analytics else None
+
             st.download_button(
                 label="📥 엑셀 다운로드",
-                data=file_to_bytes_io(create_excel_file(terminal_items)),
+                data=file_to_bytes_io(create_excel_file(terminal_items, report)),
                 file_name=filename,
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             )
+
+            if report is not None:
+                _render_analytics(report)
+
+
+def _render_analytics(report):
+    st.markdown("**📈 운항 분석**")
+    st.caption(
+        f"마스터편 {report.total}건 · 결항 {report.cancelled}건 · "
+        "지연은 도착/출발 완료편만 집계 · 점유율은 같은 기체의 도착~다음 출발 구간을 시간대별로 나눈 "
+        "일평균 비율 (기간 밖에서 도착·출발한 체류는 제외)"
+    )
+
+    tables = report.tables()
+    for table_tab, (name, headers, rows) in zip(st.tabs([name for name, _, _ in tables]), tables):
+        with table_tab:
+            st.dataframe(
+                [dict(zip(headers, row)) for row in rows],
+                hide_index=True,
+                use_container_width=True,
+            )
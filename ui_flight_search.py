@@ -0,0 +1,65 @@
+
+import streamlit as st
+
+from config import TERMINALS
+from snapshot_cache import get_snapshot
+from utils import format_hhmm
+
+_TERMINAL_NAMES = {t.terminal_id: t.name for t in TERMINALS}
+
+
+def render(tab, today, min_date, max_date):
+    with tab:
+        date_column, query_column = st.columns([1, 2])
+        with date_column:
+            search_date = st.date_input(
+                "조회 날짜",
+                value=today,
+                min_value=min_date,
+                max_value=max_date,
+                key="flight_search_date",
+            )
+        with query_column:
+            query = st.text_input(
+                "편명 · 등록기호 · 공항 · 기종",
+                placeholder="예: KE123, HL8, 나리타, B77W ... (입력 후 Enter)",
+                key="flight_search_query",
+            )
+
+        if not query.strip():
+            st.markdown(
+                '<div class="gate-caption">여러 단어를 입력하면 모두 포함된 운항편만 표시합니다</div>',
+                unsafe_allow_html=True,
+            )
+            return
+
+        # 날짜별 스냅샷과 색인은 캐시되어 입력마다 API를 호출하지 않음
+        with st.spinner("운항 데이터 불러오는 중..."):
+            snapshot = get_snapshot(search_date.strftime("%Y%m%d"))
+
+        results, total = snapshot.index.search(query)
+        if not results:
+            st.info(f"**{query}** 에 해당하는 운항편이 없습니다.")
+            return
+
+        shown = f"{total}건" if total == len(results) else f"{total}건 중 앞 {len(results)}건 표시"
+        st.caption(f"{shown} · 기준 {snapshot.fetched_at.strftime('%H:%M:%S')} (KST)")
+        st.dataframe(
+            [
+                {
+                    "시간": format_hhmm(tagged.item.actual_datetime or tagged.item.scheduled_datetime),
+                    "출도착": tagged.flight_type.emoji_label,
+                    "편명": tagged.item.flight_number or "-",
+                    "등록기호": tagged.item.registration_number or "-",
+                    "주기장": tagged.item.gate_number or "-",
+                    "터미널": _TERMINAL_NAMES.get(tagged.item.terminal_id, "-"),
+                    "공항": tagged.item.airport_name or "-",
+                    "기종": tagged.item.aircraft_type or "-",
+                    "상태": tagged.item.remark or "-",
+                    "코드쉐어": "" if tagged.item.is_master else "✓",
+                }
+                for tagged in results
+            ],
+            hide_index=True,
+            use_container_width=True,
+        )
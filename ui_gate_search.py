@@ -1,11 +1,23 @@
 
 import streamlit as st
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
+from http_client import UPSTREAM_ERRORS, Deadline
 from models import FlightType
-from services import GateFlight, fetch_gate_flights, filter_future_flights
+from services import GateFlight, fetch_gate_flights, fetch_upcoming_gate_flights, filter_future_flights
+from snapshot_cache import peek_day_flights
 from utils import format_hhmm
-from config import KST
+from config import GATE_SEARCH_BUDGET_SECONDS, KST
+
+# 조회 범위 선택지 → 기준 시간 이후 조회할 시간(None 이면 선택 날짜 하루만 조회)
+_HORIZON_OPTIONS = {
+    "선택 날짜": None,
+    "다음 6시간": 6,
+    "다음 12시간": 12,
+    "다음 24시간": 24,
+}
+
+_UPSTREAM_FAILURE_MESSAGE = "운항 API 응답이 지연되거나 실패했고 저장된 데이터도 없습니다. 잠시 후 다시 조회해주세요."
 
 
 def _color(flight_type: FlightType) -> str:
@@ -30,14 +42,22 @@ def _sta_label(flight_type: FlightType) -> str:
     return "계획 도착(STA)" if flight_type is FlightType.ARRIVAL else "계획 출발(STD)"
 
 
-def _render_flight_row(gf: GateFlight):
+def _day_marker(gf: GateFlight, reference_date: date | None) -> str:
+    # 자정을 넘는 조회 범위에서 기준 날짜와 다른 날의 운항편 표시 (예: +1일 10/20)
+    if reference_date is None or gf.parsed_time.date() == reference_date:
+        return ""
+    day_offset = (gf.parsed_time.date() - reference_date).days
+    return f'<span class="day-marker">{day_offset:+d}일 {gf.parsed_time.strftime("%m/%d")}</span>'
+
+
+def _render_flight_row(gf: GateFlight, reference_date: date | None = None):
     item = gf.item
     ft = gf.flight_type
     display_time = format_hhmm(item.actual_datetime or item.scheduled_datetime)
 
     st.markdown(f"""
     <div class="next-flight-row" style="border-left-color: {_color(ft)};">
-        <span class="nf-time">{display_time}</span>
+        <span class="nf-time">{display_time}</span>{_day_marker(gf, reference_date)}
         &nbsp;&nbsp;
         <span class="nf-info">
             <span class="nf-label">출도착</span> {ft.emoji_label}
@@ -54,7 +74,7 @@ def _render_flight_row(gf: GateFlight):
     """, unsafe_allow_html=True)
 
 
-def _render_main_card(gf: GateFlight, gate: str):
+def _render_main_card(gf: GateFlight, gate: str, reference_date: date | None = None):
     item = gf.item
     ft = gf.flight_type
     eta = format_hhmm(item.actual_datetime)
@@ -65,7 +85,7 @@ def _render_main_card(gf: GateFlight, gate: str):
     <div class="flight-card" style="background: {_background(ft)};">
         <div class="label">게이트 {gate} · 다음 {ft.emoji_label}</div>
         <h2>{item.flight_number or "-"}</h2>
-        <div class="time-big">{display_time}</div>
+        <div class="time-big">{display_time}{_day_marker(gf, reference_date)}</div>
         <div class="label">{_eta_label(ft)}</div>
         <div class="value">{eta}</div>
         <div class="label">{_sta_label(ft)}</div>
@@ -79,11 +99,46 @@ def _render_main_card(gf: GateFlight, gate: str):
     """, unsafe_allow_html=True)
 
 
+def _render_upcoming(future: list[GateFlight], gate: str, reference_date: date | None = None):
+    _render_main_card(future[0], gate, reference_date)
+
+    if len(future) > 1:
+        st.markdown(f"**이후 운항 예정 ({len(future) - 1}건)**")
+        for gf in future[1:]:
+            _render_flight_row(gf, reference_date)
+
+
+def _render_stale_notice(stale_since: datetime | None):
+    if stale_since is not None:
+        st.warning(
+            f"운항 API 응답이 지연되거나 실패하여 **{stale_since.strftime('%H:%M:%S')}** 에 받아 둔 데이터를 표시합니다. "
+            "최신 상태와 다를 수 있습니다."
+        )
+
+
+def _render_day_result(gate_flights: list[GateFlight], gate: str, search_date, search_time):
+    if not gate_flights:
+        st.error(f"게이트 **{gate}** 에 배정된 운항편이 없습니다.")
+        return
+
+    cutoff = datetime.combine(search_date, search_time).replace(tzinfo=KST)
+    future = filter_future_flights(gate_flights, cutoff)
+
+    if not future:
+        st.info(f"게이트 **{gate}** 에 기준 시간 이후 운항편이 없습니다.")
+        st.markdown(f"**{search_date.strftime('%Y-%m-%d')} 해당 게이트 전체 현황:**")
+        gate_flights.sort(key=lambda gf: gf.item.scheduled_datetime)
+        for gf in gate_flights:
+            _render_flight_row(gf)
+    else:
+        _render_upcoming(future, gate)
+
+
 def render(tab, today, now, min_date, max_date):
     with tab:
         st.markdown(f"현재: **{now.strftime('%Y-%m-%d %H:%M')}** (KST)")
 
-        date_column, time_column, gate_column = st.columns([1, 1, 1])
+        date_column, time_column, horizon_column, gate_column = st.columns([1, 1, 1, 1])
         with date_column:
             search_date = st.date_input(
                 "조회 날짜",
@@ -98,6 +153,12 @@ def render(tab, today, now, min_date, max_date):
                 value=now.time().replace(second=0, microsecond=0),
                 key="gate_time",
             )
+        with horizon_column:
+            horizon_label = st.selectbox(
+                "조회 범위",
+                list(_HORIZON_OPTIONS),
+                key="gate_horizon",
+            )
         with gate_column:
             gate_input = st.text_input(
                 "게이트(주기장) 번호",
@@ -112,33 +173,39 @@ def render(tab, today, now, min_date, max_date):
                 st.warning("게이트 번호를 입력해주세요.")
             elif not gate_value.isdigit():
                 st.warning("게이트 번호는 숫자만 입력 가능합니다.")
-            else:
-                with st.spinner("운항 데이터 조회 중..."):
-                    gate_flights, elapsed = fetch_gate_flights(
-                        search_date.strftime("%Y%m%d"),
-                        gate_value,
-                        search_time.strftime("%H%M"),
-                    )
-
-                if not gate_flights:
-                    st.error(f"게이트 **{gate_value}** 에 배정된 운항편이 없습니다.")
+            elif _HORIZON_OPTIONS[horizon_label] is not None:
+                horizon_hours = _HORIZON_OPTIONS[horizon_label]
+                reference = datetime.combine(search_date, search_time).replace(tzinfo=KST)
+                try:
+                    with st.spinner("운항 데이터 조회 중..."):
+                        upcoming, elapsed, stale_since = fetch_upcoming_gate_flights(
+                            gate_value, reference, timedelta(hours=horizon_hours),
+                            deadline=Deadline.after(GATE_SEARCH_BUDGET_SECONDS),
+                            snapshot_lookup=peek_day_flights,
+                        )
+                except UPSTREAM_ERRORS:
+                    st.error(_UPSTREAM_FAILURE_MESSAGE)
                 else:
-                    cutoff = datetime.combine(search_date, search_time).replace(tzinfo=KST)
-                    future = filter_future_flights(gate_flights, cutoff)
-
-                    if not future:
-                        st.info(f"게이트 **{gate_value}** 에 기준 시간 이후 운항편이 없습니다.")
-                        st.markdown(f"**{search_date.strftime('%Y-%m-%d')} 해당 게이트 전체 현황:**")
-                        gate_flights.sort(key=lambda gf: gf.item.scheduled_datetime)
-                        for gf in gate_flights:
-                            _render_flight_row(gf)
+                    _render_stale_notice(stale_since)
+                    if not upcoming:
+                        st.info(f"게이트 **{gate_value}** 에 기준 시간 이후 {horizon_hours}시간 이내 운항편이 없습니다.")
                     else:
-                        _render_main_card(future[0], gate_value)
-
-                        if len(future) > 1:
-                            st.markdown(f"**이후 운항 예정 ({len(future) - 1}건)**")
-                            for gf in future[1:]:
-                                _render_flight_row(gf)
+                        _render_upcoming(upcoming, gate_value, reference.date())
+            else:
+                try:
+                    with st.spinner("운항 데이터 조회 중..."):
+                        gate_flights, elapsed, stale_since = fetch_gate_flights(
+                            search_date.strftime("%Y%m%d"),
+                            gate_value,
+                            search_time.strftime("%H%M"),
+                            deadline=Deadline.after(GATE_SEARCH_BUDGET_SECONDS),
+                            snapshot_lookup=peek_day_flights,
+                        )
+                except UPSTREAM_ERRORS:
+                    st.error(_UPSTREAM_FAILURE_MESSAGE)
+                else:
+                    _render_stale_notice(stale_since)
+                    _render_day_result(gate_flights, gate_value, search_date, search_time)
 
         st.markdown(
             '<div class="gate-caption">게이트 번호 숫자로만 검색하세요</div>',
@@ -123,6 +123,20 @@ CSS = """
         margin-right: 2px;
     }
 
+    /* ── 날짜 표시 ── */
+    /* 자정을 넘는 조회에서 기준 날짜와 다른 날 운항편의 시간 옆에 표시 (+1일 등) */
+    .day-marker {
+        display: inline-block;
+        margin-left: 6px;
+        padding: 1px 8px;
+        border-radius: 10px;
+        background: #ffb300;
+        color: #1a1a1a;
+        font-size: 0.8rem;
+        font-weight: 600;
+        vertical-align: middle;
+    }
+
     /* ── 탭 스타일 ── */
     .stTabs [data-baseweb="tab-list"] {
         background: #f0f2f6;
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+
+import config
 
 
 def format_date(raw_datetime: str) -> str:
@@ -39,3 +41,24 @@ def date_range(start: str, end: str) -> list[str]:
         dates.append(start_datetime.strftime("%Y%m%d"))
         start_datetime += timedelta(days=1)
     return dates
+
+
+def allowed_date_range(today: date) -> tuple[date, date]:
+    return (
+        today - timedelta(days=config.SEARCH_DAYS_BEFORE),
+        today + timedelta(days=config.SEARCH_DAYS_AFTER),
+    )
+
+
+def parse_api_datetime(raw: str) -> datetime | None:
+    if not raw or raw == "-":
+        return None
+    try:
+        return datetime.strptime(raw.strip(), "%Y%m%d%H%M")
+    except ValueError:
+        return None
+
+
+def gate_sort_key(gate: str) -> tuple[bool, str]:
+    # 숫자 게이트를 먼저, 자릿수와 관계없이 숫자 순으로 정렬
+    return not gate.isdigit(), gate.zfill(4)